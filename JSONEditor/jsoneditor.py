@@ -27,20 +27,55 @@ Icon behavior:
   - Set Icon Cache Folder…
   - Prefetch Missing Icons…
 
-Python 3 + Tkinter only. No external deps.
+Python 3 + Tkinter. No hard external deps; urllib3 is used for HTTP
+connection pooling when installed, with a stdlib fallback otherwise.
 """
 
+import asyncio
+import bisect
 import json
+import mmap
 import os
 import sys
 import time
 import hashlib
+import http.client
 import re
+import shutil
 import threading
-import urllib.request
+import urllib.parse
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Dict, Any, Optional, List, Tuple
 
+try:
+    import urllib3  # optional: HTTP keep-alive / connection pooling
+except Exception:
+    urllib3 = None
+
+try:
+    import orjson  # optional: much faster JSON load/save
+except Exception:
+    orjson = None
+
+try:
+    import msgspec  # optional: used for JSON load/save when orjson is absent
+except Exception:
+    msgspec = None
+
+try:
+    import aiohttp  # optional: async prefetch on a single event loop
+except Exception:
+    aiohttp = None
+
+try:
+    from PIL import Image, ImageTk  # optional: C-backed PNG decode
+except Exception:
+    Image = None
+    ImageTk = None
+
 try:
     import tkinter as tk
     from tkinter import ttk, filedialog, messagebox
@@ -49,6 +84,19 @@ except Exception as e:
     sys.exit(1)
 
 HEX_RE = re.compile(r"^[0-9a-fA-F]+$")
+_STRIP_NON_HEX_RE = re.compile(r"[^0-9A-Fa-f]")
+_CANONICAL_LOWER_HEX = re.compile(r"\A[0-9a-f]+\Z").match
+
+# width-specific validators for canonical (lowercase) ids: one C-level
+# regex match instead of a len() check plus the generic is_hex scan
+_HEX8 = re.compile(r"[0-9a-f]{8}").fullmatch
+_HEX16 = re.compile(r"[0-9a-f]{16}").fullmatch
+_HEX40 = re.compile(r"[0-9a-f]{40}").fullmatch
+
+# canonical id widths (titleid / contentid+tuid / sha1) get sys.intern'd:
+# the same strings recur as dict keys, cache paths, and UI labels, and
+# interning collapses the duplicates and makes key compares pointer checks
+_INTERN_WIDTHS = (8, 16, 40)
 
 
 # ---------------------------
@@ -66,13 +114,22 @@ def norm_hex(s: Any, width: Optional[int] = None, lower: bool = True) -> str:
     """
     if s is None:
         return ""
+    if isinstance(s, str):
+        # fast path: already canonical lowercase hex of the right width
+        # (the common case on every re-save of an already-clean database)
+        if lower and width is not None and len(s) == width and _CANONICAL_LOWER_HEX(s):
+            return sys.intern(s) if width in _INTERN_WIDTHS else s
+        return _norm_hex_str(s, width, lower)
     if isinstance(s, int):
-        out = f"{s:X}"
-    else:
-        out = str(s).strip()
-        if out.lower().startswith("0x"):
-            out = out[2:]
-    out = re.sub(r"[^0-9A-Fa-f]", "", out)
+        return _norm_hex_str(f"{s:X}", width, lower)
+    return _norm_hex_str(str(s), width, lower)
+
+@lru_cache(maxsize=8192)
+def _norm_hex_str(out: str, width: Optional[int], lower: bool) -> str:
+    out = out.strip()
+    if out[:2] in ("0x", "0X"):
+        out = out[2:]
+    out = _STRIP_NON_HEX_RE.sub("", out)
     if not out:
         return ""
     if width is not None:
@@ -81,6 +138,8 @@ def norm_hex(s: Any, width: Optional[int] = None, lower: bool = True) -> str:
         else:
             out = out.rjust(width, "0")
     out = out.lower() if lower else out.upper()
+    if lower and width in _INTERN_WIDTHS:
+        out = sys.intern(out)
     return out
 
 def ensure_single_dict_list(v: Any) -> List[Dict[str, str]]:
@@ -125,6 +184,123 @@ def ensure_dir(path: str) -> None:
 
 MOBcat_RAW_BASE = "https://raw.githubusercontent.com/MobCat/MobCats-original-xbox-game-list/main/icon"
 
+USER_AGENT = "PineconeOGXboxEditor/1.0 (+https://github.com/MrMilenko/Pinecone)"
+
+# Shared connection pool so prefetching thousands of icons reuses one TLS
+# connection per host instead of paying a fresh handshake per request.
+if urllib3 is not None:
+    _POOL = urllib3.PoolManager(
+        num_pools=4,
+        maxsize=16,
+        headers={"User-Agent": USER_AGENT},
+        retries=urllib3.Retry(total=2, backoff_factor=0.2),
+    )
+else:
+    _POOL = None
+
+# Fallback when urllib3 is missing: one persistent HTTPS connection per
+# thread (all icon URLs hit the same host). Per-thread rather than shared:
+# a single locked connection would serialize the prefetch worker pool.
+_fallback_local = threading.local()
+
+
+def _fetch_bytes(url: str, timeout: int = 12,
+                 etag: Optional[str] = None) -> Tuple[int, Optional[bytes], Optional[str]]:
+    """
+    GET url; returns (status, body, response ETag), status 0 on failure.
+    Reuses connections across calls (keep-alive). When `etag` is given it
+    is sent as If-None-Match, so an unchanged resource answers 304 with
+    headers only instead of shipping the body again.
+    """
+    if _POOL is not None:
+        headers = {"User-Agent": USER_AGENT}
+        if etag:
+            headers["If-None-Match"] = etag
+        try:
+            r = _POOL.request(
+                "GET", url,
+                timeout=urllib3.Timeout(connect=5, read=timeout),
+                preload_content=True,
+                headers=headers,
+            )
+            return r.status, r.data, r.headers.get("ETag")
+        except Exception:
+            return 0, None, None
+
+    parts = urllib.parse.urlsplit(url)
+    path = parts.path + (f"?{parts.query}" if parts.query else "")
+    headers = {"User-Agent": USER_AGENT}
+    if etag:
+        headers["If-None-Match"] = etag
+    # one retry so a stale keep-alive connection gets replaced
+    for _ in range(2):
+        try:
+            conn = getattr(_fallback_local, "conn", None)
+            if conn is None or conn.host != parts.hostname:
+                if conn is not None:
+                    conn.close()
+                conn = http.client.HTTPSConnection(parts.hostname, timeout=timeout)
+                _fallback_local.conn = conn
+            conn.request("GET", path, headers=headers)
+            resp = conn.getresponse()
+            data = resp.read()
+            return resp.status, data, resp.getheader("ETag")
+        except Exception:
+            conn = getattr(_fallback_local, "conn", None)
+            if conn is not None:
+                try:
+                    conn.close()
+                except Exception:
+                    pass
+                _fallback_local.conn = None
+    return 0, None, None
+
+
+class IconEtagStore:
+    """
+    tid -> upstream ETag sidecar (<cache_dir>/_etags.json), thread-safe.
+    Lets re-prefetches revalidate cached icons with If-None-Match instead
+    of re-transferring the PNG body.
+    """
+
+    def __init__(self, cache_dir: str):
+        self.path = os.path.join(cache_dir, "_etags.json")
+        self._lock = threading.Lock()
+        self._etags: Dict[str, str] = {}
+        self._dirty = False
+        try:
+            with open(self.path, "rb") as f:
+                raw = f.read()
+            data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+            if isinstance(data, dict):
+                self._etags = {str(k): str(v) for k, v in data.items()}
+        except Exception:
+            pass
+
+    def get(self, tid: str) -> Optional[str]:
+        with self._lock:
+            return self._etags.get(tid)
+
+    def put(self, tid: str, etag: Optional[str]) -> None:
+        if not etag:
+            return
+        with self._lock:
+            if self._etags.get(tid) != etag:
+                self._etags[tid] = etag
+                self._dirty = True
+
+    def flush(self) -> None:
+        with self._lock:
+            if not self._dirty:
+                return
+            payload = (orjson.dumps(self._etags) if orjson is not None
+                       else json.dumps(self._etags).encode("utf-8"))
+            self._dirty = False
+        try:
+            _write_cached(payload, self.path)
+        except OSError:
+            pass
+
 def default_icon_cache_dir(json_path: str) -> str:
     """
     Default cache folder near the JSON (portable):
@@ -134,7 +310,52 @@ def default_icon_cache_dir(json_path: str) -> str:
     return os.path.join(base, "data", "icons")
 
 def icon_cache_path(cache_dir: str, title_id_hex_8: str) -> str:
-    return os.path.join(cache_dir, f"{title_id_hex_8.lower()}.png")
+    # sharded by the first two hex chars so no single directory ever holds
+    # thousands of files (slow stats on NTFS/APFS, painful in Explorer)
+    tid = title_id_hex_8.lower()
+    return os.path.join(cache_dir, tid[:2], f"{tid}.png")
+
+def scan_icon_cache(cache_dir: str) -> set:
+    """
+    Title ids with a cached icon, via one scandir pass per shard instead
+    of a stat() per title.
+    """
+    existing = set()
+    try:
+        with os.scandir(cache_dir) as shards:
+            for shard in shards:
+                if not shard.is_dir():
+                    continue
+                with os.scandir(shard.path) as entries:
+                    for entry in entries:
+                        if entry.name.endswith(".png"):
+                            existing.add(entry.name[:-4])
+    except OSError:
+        pass
+    return existing
+
+def migrate_flat_icon_cache(cache_dir: str) -> None:
+    """
+    One-shot, best-effort move of icons from the old flat layout
+    (<cache>/<tid>.png) into the sharded layout (<cache>/<tid[:2]>/...).
+    """
+    try:
+        with os.scandir(cache_dir) as entries:
+            for entry in entries:
+                name = entry.name
+                if not (entry.is_file() and name.endswith(".png") and len(name) == 12):
+                    continue
+                tid = name[:-4]
+                if not is_hex(tid):
+                    continue
+                dest = icon_cache_path(cache_dir, tid)
+                ensure_dir(os.path.dirname(dest))
+                try:
+                    os.rename(entry.path, dest)
+                except OSError:
+                    pass
+    except OSError:
+        pass
 
 def mobcat_icon_url(title_id_hex_8: str) -> str:
     """
@@ -142,29 +363,143 @@ def mobcat_icon_url(title_id_hex_8: str) -> str:
       .../icon/<TID[:4]>/<TID>.png
     Example:
       .../icon/4541/4541000D.png
+
+    Callers pass canonical 8-hex-lower title ids, so this is just an
+    upper + slice — no norm_hex round-trip in the prefetch hot loop.
     """
-    tid = norm_hex(title_id_hex_8, width=8, lower=False)  # upper
-    prefix = tid[:4]
-    return f"{MOBcat_RAW_BASE}/{prefix}/{tid}.png"
+    tid = title_id_hex_8.upper()
+    return f"{MOBcat_RAW_BASE}/{tid[:4]}/{tid}.png"
+
+def _write_cached(data: bytes, out_path: str) -> None:
+    """
+    Atomically write a cache file, deliberately without fsync — icons are
+    re-downloadable, so a torn file after a crash just gets re-fetched.
+    On Linux, O_TMPFILE + link avoids creating a visible temp entry at
+    all; elsewhere fall back to temp-name + os.replace.
+    """
+    cache_dir = os.path.dirname(out_path)
+    if hasattr(os, "O_TMPFILE"):
+        try:
+            fd = os.open(cache_dir, os.O_TMPFILE | os.O_WRONLY, 0o644)
+            try:
+                os.write(fd, data)
+                os.link(f"/proc/self/fd/{fd}", out_path)
+            finally:
+                os.close(fd)
+            return
+        except OSError:
+            # no O_TMPFILE support on this fs, or out_path already exists
+            pass
+    tmp = f"{out_path}.tmp.{os.getpid()}"
+    with open(tmp, "wb") as f:
+        f.write(data)
+    os.replace(tmp, out_path)
+
+
+def looks_png(data: Optional[bytes]) -> bool:
+    return bool(data) and len(data) > 16 and data.startswith(b"\x89PNG\r\n\x1a\n")
+
 
-def download_to_file(url: str, out_path: str, timeout: int = 12) -> bool:
+def _store_icon(data: bytes, out_path: str) -> None:
+    ensure_dir(os.path.dirname(out_path))
+    _write_cached(data, out_path)
+
+
+async def _prefetch_icons_async(work, cancel, progress, etag_store=None) -> int:
+    """
+    Fetch missing icons — and revalidate cached ones via If-None-Match —
+    concurrently on one event loop. Hundreds of requests overlap on a
+    single thread; aiohttp pools connections per host, bounded by the
+    semaphore/connector limit.
+    """
+    sem = asyncio.Semaphore(16)
+    counts = {"scanned": 0, "fetched": 0}
+
+    async with aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(limit=16),
+        headers={"User-Agent": USER_AGENT},
+    ) as session:
+        async def fetch_one(tid: str, out_path: str):
+            if cancel.is_set():
+                return
+            async with sem:
+                headers = None
+                if etag_store is not None and os.path.exists(out_path):
+                    etag = etag_store.get(tid)
+                    if etag:
+                        headers = {"If-None-Match": etag}
+                data = None
+                new_etag = None
+                not_modified = False
+                try:
+                    async with session.get(
+                        mobcat_icon_url(tid),
+                        timeout=aiohttp.ClientTimeout(total=30),
+                        headers=headers,
+                    ) as r:
+                        if r.status == 200:
+                            data = await r.read()
+                            new_etag = r.headers.get("ETag")
+                        elif r.status == 304:
+                            not_modified = True
+                except Exception:
+                    data = None
+                ok = not_modified or looks_png(data)
+                if ok and not not_modified:
+                    await asyncio.to_thread(_store_icon, data, out_path)
+                    if etag_store is not None:
+                        etag_store.put(tid, new_etag)
+                counts["scanned"] += 1
+                counts["fetched"] += 1 if ok else 0
+                progress(counts["scanned"], counts["fetched"])
+
+        await asyncio.gather(*(fetch_one(tid, p) for tid, p in work),
+                             return_exceptions=True)
+    return counts["fetched"]
+
+
+ICON_SIZE = (64, 64)
+
+# cap on decoded icons kept in memory; evicted ones re-decode from disk
+ICON_MEM_MAX = 128
+
+def load_icon_photo(path: str) -> tk.PhotoImage:
+    """
+    Decode a cached icon into a PhotoImage. Pillow's C decoder is much
+    faster than Tk's own PNG path; fall back to tk.PhotoImage without it.
+    """
+    if Image is not None:
+        img = Image.open(path).convert("RGBA")
+        if img.size != ICON_SIZE:
+            resample = getattr(Image, "Resampling", Image).LANCZOS
+            img = img.resize(ICON_SIZE, resample)
+        return ImageTk.PhotoImage(img)
+    return tk.PhotoImage(file=path)
+
+
+def download_to_file(url: str, out_path: str, timeout: int = 12,
+                     etag_store: Optional[IconEtagStore] = None,
+                     tid: Optional[str] = None) -> bool:
     try:
-        req = urllib.request.Request(
-            url,
-            headers={"User-Agent": "PineconeOGXboxEditor/1.0 (+https://github.com/MrMilenko/Pinecone)"}
-        )
-        with urllib.request.urlopen(req, timeout=timeout) as r:
-            data = r.read()
+        # only revalidate when we still hold the body the ETag refers to
+        etag = None
+        if etag_store is not None and tid and os.path.exists(out_path):
+            etag = etag_store.get(tid)
 
-        # sanity
-        if not data or len(data) < 256:
-            return False
-        if b"<html" in data[:512].lower():
+        status, data, new_etag = _fetch_bytes(url, timeout=timeout, etag=etag)
+
+        if status == 304:
+            return True  # cached copy is still current upstream
+
+        # sanity: must actually be a PNG (also rejects HTML error pages
+        # served with a 200, without the old size/substring heuristics)
+        if status != 200 or not looks_png(data):
             return False
 
         ensure_dir(os.path.dirname(out_path))
-        with open(out_path, "wb") as f:
-            f.write(data)
+        _write_cached(data, out_path)
+        if etag_store is not None and tid:
+            etag_store.put(tid, new_etag)
         return True
     except Exception:
         return False
@@ -182,6 +517,24 @@ class TitleRecord:
     title_updates: List[str] = field(default_factory=list) # 16 hex lower
     tu_known: Dict[str, str] = field(default_factory=dict) # sha1(lower) -> label
     archived: Dict[str, str] = field(default_factory=dict) # contentid(lower) -> name
+    # True while every field still holds exactly what from_json normalized;
+    # lets to_json_obj skip the norm_hex/sorted round-trip on clean saves
+    _canonical: bool = field(default=False, repr=False)
+    # sorted (sha1, label) view for the KNOWN listbox, built lazily by
+    # _known_visible_list; mark_mutated drops it so the next read re-sorts
+    _known_sorted: Optional[List[Tuple[str, str]]] = field(default=None, repr=False)
+    # lazy set mirror of content_ids for O(1) membership, same lifecycle
+    _cid_set: Optional[set] = field(default=None, repr=False)
+
+    def mark_mutated(self):
+        self._canonical = False
+        self._known_sorted = None
+        self._cid_set = None
+
+    def cid_set(self) -> set:
+        if self._cid_set is None:
+            self._cid_set = set(self.content_ids)
+        return self._cid_set
 
     @staticmethod
     def from_json(title_id: str, obj: Dict[str, Any]) -> "TitleRecord":
@@ -232,33 +585,49 @@ class TitleRecord:
             title_updates=title_updates,
             tu_known=tu_known_norm,
             archived=archived_norm,
+            _canonical=True,
         )
 
     def to_json_obj(self) -> Dict[str, Any]:
+        if self._canonical:
+            # untouched since from_json: fields are already normalized,
+            # sorted, and de-duplicated
+            cids = list(self.content_ids)
+            tus = list(self.title_updates)
+        else:
+            cids = sorted({norm_hex(x, width=16, lower=True) for x in self.content_ids if x})
+            tus = sorted({norm_hex(x, width=16, lower=True) for x in self.title_updates if x})
+
         obj = {
             "Title Name": self.title_name or "",
-            "Content IDs": sorted(set([norm_hex(x, width=16, lower=True) for x in self.content_ids if x])),
-            "Title Updates": sorted(set([norm_hex(x, width=16, lower=True) for x in self.title_updates if x])),
+            "Content IDs": cids,
+            "Title Updates": tus,
             "Title Updates Known": [],
             "Archived": [],
         }
 
         # preserve the exact "list length 0 or 1" structure
         if self.tu_known:
-            d = {}
-            for sha1, label in self.tu_known.items():
-                sha1_n = norm_hex(sha1, width=40, lower=True)
-                if sha1_n:
-                    d[sha1_n] = str(label)
+            if self._canonical:
+                d = dict(self.tu_known)
+            else:
+                d = {}
+                for sha1, label in self.tu_known.items():
+                    sha1_n = norm_hex(sha1, width=40, lower=True)
+                    if sha1_n:
+                        d[sha1_n] = str(label)
             if d:
                 obj["Title Updates Known"] = [d]
 
         if self.archived:
-            d = {}
-            for cid, label in self.archived.items():
-                cid_n = norm_hex(cid, width=16, lower=True)
-                if cid_n:
-                    d[cid_n] = str(label)
+            if self._canonical:
+                d = dict(self.archived)
+            else:
+                d = {}
+                for cid, label in self.archived.items():
+                    cid_n = norm_hex(cid, width=16, lower=True)
+                    if cid_n:
+                        d[cid_n] = str(label)
             if d:
                 obj["Archived"] = [d]
 
@@ -269,49 +638,110 @@ class IdDatabaseModel:
     def __init__(self):
         self.path: Optional[str] = None
         self.dirty: bool = False
-        self.titles: Dict[str, TitleRecord] = {}  # key = titleid8hex lower
+        # key = titleid8hex lower; value is the raw JSON dict until first
+        # real access, then a promoted TitleRecord (see get())
+        self.titles: Dict[str, Any] = {}
 
     def load(self, path: str):
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        with open(path, "rb") as f:
+            raw = f.read()
+        if orjson is not None:
+            data = orjson.loads(raw)
+        elif msgspec is not None:
+            data = msgspec.json.decode(raw)
+        else:
+            data = json.loads(raw)
 
         if not isinstance(data, dict) or "Titles" not in data or not isinstance(data["Titles"], dict):
             raise ValueError("Not a valid OG Xbox id_database.json (missing top-level 'Titles' object)")
 
+        # keep titles raw here — normalizing every id of every title up
+        # front is wasted work when a session touches only a handful
         titles_obj: Dict[str, Any] = data["Titles"]
-        out: Dict[str, TitleRecord] = {}
+        out: Dict[str, Any] = {}
         for tid, obj in titles_obj.items():
-            tr = TitleRecord.from_json(tid, safe_title_obj(obj))
-            if tr.title_id:
-                out[tr.title_id] = tr
+            tid_n = norm_hex(tid, width=8, lower=True)
+            if tid_n:
+                out[tid_n] = safe_title_obj(obj)
 
         self.titles = out
         self.path = path
         self.dirty = False
 
+    def get(self, title_id: str) -> Optional[TitleRecord]:
+        """
+        Fetch a TitleRecord, promoting the raw JSON dict to a normalized
+        record on first access and caching the result.
+        """
+        tid = norm_hex(title_id, width=8, lower=True)
+        v = self.titles.get(tid)
+        if v is None or isinstance(v, TitleRecord):
+            return v
+        tr = TitleRecord.from_json(tid, v)
+        self.titles[tid] = tr
+        return tr
+
+    def title_name_of(self, title_id: str) -> str:
+        """Title name for display, without forcing promotion."""
+        v = self.titles.get(title_id)
+        if v is None:
+            return ""
+        if isinstance(v, TitleRecord):
+            return v.title_name
+        return str(v.get("Title Name", "") or "")
+
     def save(self, path: Optional[str] = None):
         if path is None:
             path = self.path
         if not path:
             raise ValueError("No path to save")
 
-        # backup
+        # backup: hardlink is a zero-copy snapshot of the old file (safe
+        # because the save below replaces rather than rewrites in place);
+        # fall back to a streamed copy where links aren't supported
         if os.path.exists(path):
             bak = f"{path}.bak-{now_ts()}"
             try:
-                with open(path, "rb") as rf, open(bak, "wb") as wf:
-                    wf.write(rf.read())
-            except Exception as e:
-                print("Backup failed:", e)
+                os.link(path, bak)
+            except OSError:
+                try:
+                    shutil.copyfile(path, bak)
+                except Exception as e:
+                    print("Backup failed:", e)
 
         titles_out = {}
         for tid in sorted(self.titles.keys()):
-            titles_out[tid] = self.titles[tid].to_json_obj()
+            v = self.titles[tid]
+            # never-touched titles pass through as-is; promoted records
+            # re-serialize from their normalized form
+            titles_out[tid] = v.to_json_obj() if isinstance(v, TitleRecord) else safe_title_obj(v)
 
         out = {"Titles": titles_out}
 
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(out, f, indent=2, ensure_ascii=False)
+        # serialize to one bytes buffer, then write-to-temp + fsync +
+        # os.replace so a crash mid-save can never leave a torn file
+        if orjson is not None:
+            # orjson emits UTF-8 bytes directly; key order (titles sorted
+            # above, fixed field order inside each title) is preserved
+            buf = orjson.dumps(out, option=orjson.OPT_INDENT_2)
+        elif msgspec is not None:
+            buf = msgspec.json.format(msgspec.json.encode(out), indent=2)
+        else:
+            buf = json.dumps(out, indent=2, ensure_ascii=False).encode("utf-8")
+
+        tmp = f"{path}.tmp.{os.getpid()}"
+        try:
+            with open(tmp, "wb") as f:
+                f.write(buf)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp, path)
+        except BaseException:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+            raise
 
         self.path = path
         self.dirty = False
@@ -326,13 +756,92 @@ class IdDatabaseModel:
         if tid not in self.titles:
             self.titles[tid] = TitleRecord(title_id=tid, title_name="")
             self.mark_dirty()
-        return self.titles[tid]
+        return self.get(tid)
 
 
 # ---------------------------
 # UI
 # ---------------------------
 
+class LazyListbox(tk.Listbox):
+    """
+    Listbox that renders a large label list in chunks: the first chunk
+    immediately via set_items(), the rest as the user scrolls toward the
+    bottom. Keeps the Listbox API — surgical insert/delete calls from the
+    outside stay in sync with the backing label list.
+    """
+
+    CHUNK = 500
+
+    def __init__(self, master=None, **kw):
+        self._labels: List[str] = []
+        self._rendered = 0
+        kw.setdefault("yscrollcommand", self._on_scroll)
+        super().__init__(master, **kw)
+
+    def set_items(self, labels: List[str]) -> None:
+        tk.Listbox.delete(self, 0, "end")
+        self._labels = list(labels)
+        self._rendered = 0
+        self._render_more()
+
+    def ensure_rendered(self, idx: int) -> None:
+        """Make sure row `idx` exists in the widget (for selection/edits)."""
+        if idx >= self._rendered:
+            self._render_more(upto=idx + 1)
+
+    def _render_more(self, upto: Optional[int] = None) -> None:
+        if upto is None:
+            upto = self._rendered + self.CHUNK
+        upto = min(upto, len(self._labels))
+        if upto > self._rendered:
+            tk.Listbox.insert(self, "end", *self._labels[self._rendered:upto])
+            self._rendered = upto
+
+    def _on_scroll(self, first: str, last: str) -> None:
+        if float(last) > 0.9 and self._rendered < len(self._labels):
+            self._render_more()
+
+    def size(self):
+        # the backing row count, not the rendered count — callers reason
+        # about rows they can see in _labels, rendered or not
+        return len(self._labels)
+
+    def insert(self, index, *elements):
+        if not elements:
+            return
+        if index == "end":
+            self._labels.extend(elements)
+            if self._rendered == len(self._labels) - len(elements):
+                tk.Listbox.insert(self, "end", *elements)
+                self._rendered = len(self._labels)
+            return
+        self.ensure_rendered(index)
+        tk.Listbox.insert(self, index, *elements)
+        self._labels[index:index] = list(elements)
+        self._rendered += len(elements)
+
+    def delete(self, first, last=None):
+        if last == "end":
+            if first >= self._rendered:
+                del self._labels[first:]
+                return
+            tk.Listbox.delete(self, first, "end")
+            del self._labels[first:]
+            self._rendered = first
+            return
+        if last is None:
+            self.ensure_rendered(first)
+            tk.Listbox.delete(self, first)
+            del self._labels[first]
+            self._rendered -= 1
+            return
+        self.ensure_rendered(last)
+        tk.Listbox.delete(self, first, last)
+        del self._labels[first:last + 1]
+        self._rendered -= (last - first + 1)
+
+
 class IdDatabaseEditor(ttk.Frame):
     def __init__(self, master):
         super().__init__(master)
@@ -342,12 +851,28 @@ class IdDatabaseEditor(ttk.Frame):
         # selection state
         self._selected_title_id: Optional[str] = None
 
+        # title list state: full sorted index, current filtered view, and
+        # how many filtered rows are actually in the Listbox (rows are
+        # rendered in chunks as the user scrolls, not all up front)
+        self._all_titles: Optional[List[Tuple[str, str, str]]] = None  # (tid, display, display lower)
+        self._visible_titles: List[Tuple[str, str, str]] = []
+        self._rendered_count: int = 0
+        # (last query, its filtered rows): typing forward only narrows the
+        # previous result instead of re-filtering all titles
+        self._search_cache: Tuple[str, List[Tuple[str, str, str]]] = ("", [])
+        self._search_after_id: Optional[str] = None  # pending debounced repopulate
+        self._search_q_lower: str = ""  # normalized query, set once per search edit
+        self._ui_dirty: set[str] = set()  # bucket tabs awaiting an idle refresh
+
         # icon state
         self.icon_cache_dir: Optional[str] = None
         self._icon_photo: Optional[tk.PhotoImage] = None
-        self._icon_mem: Dict[str, tk.PhotoImage] = {}          # tid -> PhotoImage
+        self._icon_label_text: str = ""
+        self._icon_mem: "OrderedDict[str, tk.PhotoImage]" = OrderedDict()  # tid -> PhotoImage, LRU order
         self._icon_fetch_inflight: set[str] = set()            # tid
         self._placeholder_photo: Optional[tk.PhotoImage] = None
+        self._prefetch_cancel: Optional[threading.Event] = None
+        self._icon_etags: Optional[IconEtagStore] = None
 
         self._build_ui()
         self._bind_accels()
@@ -397,7 +922,7 @@ class IdDatabaseEditor(ttk.Frame):
         # left: search + list + icon preview
         ttk.Label(left, text="Search Titles").grid(row=0, column=0, sticky="w")
         self.search_var = tk.StringVar()
-        self.search_var.trace_add("write", lambda *_: self.populate_titles())
+        self.search_var.trace_add("write", lambda *_: self._schedule_search())
         ttk.Entry(left, textvariable=self.search_var, width=32).grid(row=1, column=0, sticky="we", pady=(0, 6))
         left.columnconfigure(0, weight=1)
 
@@ -410,11 +935,14 @@ class IdDatabaseEditor(ttk.Frame):
         self._placeholder_photo = tk.PhotoImage(width=1, height=1)
         self.icon_label = ttk.Label(iconf, image=self._placeholder_photo, text="(no icon)", compound="left")
         self.icon_label.grid(row=0, column=0, sticky="we", padx=6, pady=6)
+        self._icon_photo = self._placeholder_photo
+        self._icon_label_text = "(no icon)"
 
         self.icon_status = ttk.Label(iconf, text="Idle")
         self.icon_status.grid(row=1, column=0, sticky="we", padx=6, pady=(0, 6))
 
-        self.titles_list = tk.Listbox(left, height=26, exportselection=False)
+        self.titles_list = tk.Listbox(left, height=26, exportselection=False,
+                                      yscrollcommand=self._on_titles_scroll)
         self.titles_list.grid(row=3, column=0, sticky="nswe")
         self.titles_list.bind("<<ListboxSelect>>", lambda e: self.on_title_select())
         left.rowconfigure(3, weight=1)
@@ -506,7 +1034,7 @@ class IdDatabaseEditor(ttk.Frame):
         parent.columnconfigure(0, weight=1)
         ttk.Label(parent, text="DLC Content IDs (from 'Content IDs'; names live in Archived map)").grid(row=0, column=0, sticky="w", padx=6, pady=6)
 
-        self.lst_dlc = tk.Listbox(parent, height=10, exportselection=False)
+        self.lst_dlc = LazyListbox(parent, height=10, exportselection=False)
         self.lst_dlc.grid(row=1, column=0, sticky="we", padx=6)
         self.lst_dlc.bind("<<ListboxSelect>>", lambda e: self.on_bucket_select("DLC"))
 
@@ -519,7 +1047,7 @@ class IdDatabaseEditor(ttk.Frame):
         parent.columnconfigure(0, weight=1)
         ttk.Label(parent, text="Title Updates (from 'Title Updates')").grid(row=0, column=0, sticky="w", padx=6, pady=6)
 
-        self.lst_tu = tk.Listbox(parent, height=10, exportselection=False)
+        self.lst_tu = LazyListbox(parent, height=10, exportselection=False)
         self.lst_tu.grid(row=1, column=0, sticky="we", padx=6)
         self.lst_tu.bind("<<ListboxSelect>>", lambda e: self.on_bucket_select("TU"))
 
@@ -532,7 +1060,7 @@ class IdDatabaseEditor(ttk.Frame):
         parent.columnconfigure(0, weight=1)
         ttk.Label(parent, text="Known Title Updates (from 'Title Updates Known'[0]: SHA1 -> value string)").grid(row=0, column=0, sticky="w", padx=6, pady=6)
 
-        self.lst_known = tk.Listbox(parent, height=10, exportselection=False)
+        self.lst_known = LazyListbox(parent, height=10, exportselection=False)
         self.lst_known.grid(row=1, column=0, sticky="we", padx=6)
         self.lst_known.bind("<<ListboxSelect>>", lambda e: self.on_bucket_select("KNOWN"))
 
@@ -573,23 +1101,36 @@ class IdDatabaseEditor(ttk.Frame):
         self.icon_status.configure(text=txt)
 
     def _clear_icon(self, txt: str = "(no icon)") -> None:
+        # skip the configure (and the redraw Tk schedules for it) when the
+        # placeholder with this text is already showing
+        if self._icon_photo is self._placeholder_photo and self._icon_label_text == txt:
+            return
         self._icon_photo = self._placeholder_photo
+        self._icon_label_text = txt
         self.icon_label.configure(image=self._placeholder_photo, text=txt)
-        self.icon_label.image = self._placeholder_photo
 
     def _apply_icon_photo(self, tid: str, photo: tk.PhotoImage, status: str) -> None:
+        self._icon_mem[tid] = photo
+        self._icon_mem.move_to_end(tid)
+        while len(self._icon_mem) > ICON_MEM_MAX:
+            self._icon_mem.popitem(last=False)
+        self._set_icon_status(status)
+        if self._icon_photo is photo:
+            return  # already displayed
         self._icon_photo = photo
+        self._icon_label_text = ""
         self.icon_label.configure(image=photo, text="")
-        self.icon_label.image = photo
-        self._set_icon_status(status)
-        self._icon_mem[tid] = photo
 
     def _ensure_icon_cache_dir(self) -> Optional[str]:
         if self.icon_cache_dir:
+            if self._icon_etags is None:
+                self._icon_etags = IconEtagStore(self.icon_cache_dir)
             return self.icon_cache_dir
         if self.model.path:
             self.icon_cache_dir = default_icon_cache_dir(self.model.path)
             ensure_dir(self.icon_cache_dir)
+            migrate_flat_icon_cache(self.icon_cache_dir)
+            self._icon_etags = IconEtagStore(self.icon_cache_dir)
             return self.icon_cache_dir
         return None
 
@@ -616,11 +1157,15 @@ class IdDatabaseEditor(ttk.Frame):
         p = icon_cache_path(cache_dir, tid)
         if os.path.exists(p):
             try:
-                photo = tk.PhotoImage(file=p)
+                photo = load_icon_photo(p)
                 self._apply_icon_photo(tid, photo, f"Icon: cached ({os.path.basename(p)})")
                 return
             except Exception as e:
                 self._set_icon_status(f"Icon decode failed, re-downloading ({e})")
+                try:
+                    os.unlink(p)  # corrupt; a 304 revalidation would keep it
+                except OSError:
+                    pass
                 # fall through to download
 
         # already inflight?
@@ -637,13 +1182,13 @@ class IdDatabaseEditor(ttk.Frame):
             ok = False
             try:
                 url = mobcat_icon_url(tid)
-                ok = download_to_file(url, p)
+                ok = download_to_file(url, p, etag_store=self._icon_etags, tid=tid)
             finally:
                 def done():
                     self._icon_fetch_inflight.discard(tid)
                     if ok and os.path.exists(p):
                         try:
-                            photo = tk.PhotoImage(file=p)
+                            photo = load_icon_photo(p)
                             self._apply_icon_photo(tid, photo, f"Icon: downloaded ({os.path.basename(p)})")
                         except Exception as e:
                             self._clear_icon("(icon failed)")
@@ -667,6 +1212,8 @@ class IdDatabaseEditor(ttk.Frame):
             return
         self.icon_cache_dir = path
         ensure_dir(self.icon_cache_dir)
+        migrate_flat_icon_cache(self.icon_cache_dir)
+        self._icon_etags = IconEtagStore(self.icon_cache_dir)
         self._set_icon_status(f"Icon cache set: {self.icon_cache_dir}")
         # refresh current icon
         tr = self.current_title()
@@ -690,33 +1237,71 @@ class IdDatabaseEditor(ttk.Frame):
         # confirm
         if not messagebox.askyesno(
             "Prefetch Missing Icons",
-            f"This will download any missing icons into:\n\n{cache_dir}\n\nContinue?"
+            f"This will download missing icons into:\n\n{cache_dir}\n\n"
+            "and revalidate already-cached ones.\n\nContinue?"
         ):
             return
 
         tids = sorted(self.model.titles.keys())
         self._set_icon_status("Prefetch: starting…")
+        cancel = self._prefetch_cancel = threading.Event()
 
         def worker():
-            missing = 0
-            fetched = 0
-            for i, tid in enumerate(tids, start=1):
-                p = icon_cache_path(cache_dir, tid)
-                if os.path.exists(p):
-                    continue
-                missing += 1
-                url = mobcat_icon_url(tid)
-                ok = download_to_file(url, p)
-                if ok:
-                    fetched += 1
+            existing = scan_icon_cache(cache_dir)
+            etags = self._icon_etags
+            # missing icons are fetched outright; cached icons with a stored
+            # ETag are re-enqueued so If-None-Match can revalidate them
+            # (304 = still current, 200 rewrites the file)
+            work = [
+                (tid, icon_cache_path(cache_dir, tid))
+                for tid in tids
+                if tid not in existing or (etags is not None and etags.get(tid))
+            ]
+            total = len(work)
+
+            def progress(scanned: int, fetched: int):
                 # update occasionally
-                if i % 25 == 0 or i == len(tids):
-                    def upd(i=i, total=len(tids), fetched=fetched, missing=missing):
-                        self._set_icon_status(f"Prefetch: {i}/{total} scanned, downloaded {fetched}/{missing} missing")
+                if scanned % 25 == 0 or scanned == total:
+                    def upd(i=scanned, total=total, fetched=fetched):
+                        self._set_icon_status(f"Prefetch: {i}/{total} checked, {fetched} current")
                     self.master.after(0, upd)
 
+            if aiohttp is not None:
+                # overlap all requests on one event loop in this thread
+                fetched = asyncio.run(_prefetch_icons_async(work, cancel, progress,
+                                                            etag_store=self._icon_etags))
+            else:
+                # each download is independent I/O, so fan out over a
+                # bounded pool (connections come from the shared pool)
+                fetched = 0
+                scanned = 0
+                with ThreadPoolExecutor(max_workers=8) as ex:
+                    futures = {
+                        ex.submit(download_to_file, mobcat_icon_url(tid), p,
+                                  etag_store=self._icon_etags, tid=tid): tid
+                        for tid, p in work
+                    }
+                    for fut in as_completed(futures):
+                        if cancel.is_set():
+                            for f in futures:
+                                f.cancel()
+                            return
+                        scanned += 1
+                        try:
+                            if fut.result():
+                                fetched += 1
+                        except Exception:
+                            pass
+                        progress(scanned, fetched)
+
+            if self._icon_etags is not None:
+                self._icon_etags.flush()
+
+            if cancel.is_set():
+                return
+
             def done():
-                self._set_icon_status(f"Prefetch complete: downloaded {fetched}/{missing} missing")
+                self._set_icon_status(f"Prefetch complete: {fetched}/{total} fetched or revalidated")
                 # refresh current selection icon
                 tr = self.current_title()
                 if tr:
@@ -748,11 +1333,14 @@ class IdDatabaseEditor(ttk.Frame):
         if not self.icon_cache_dir:
             self.icon_cache_dir = default_icon_cache_dir(path)
             ensure_dir(self.icon_cache_dir)
+            migrate_flat_icon_cache(self.icon_cache_dir)
+            self._icon_etags = IconEtagStore(self.icon_cache_dir)
 
         # clear mem cache when switching databases
         self._icon_mem.clear()
         self._icon_fetch_inflight.clear()
 
+        self._invalidate_title_index()
         self.populate_titles(select_first=True)
         self._update_title()
 
@@ -793,6 +1381,10 @@ class IdDatabaseEditor(ttk.Frame):
     def action_exit(self):
         if not self.prompt_save_if_dirty():
             return
+        if self._prefetch_cancel is not None:
+            self._prefetch_cancel.set()
+        if self._icon_etags is not None:
+            self._icon_etags.flush()  # keep ETags from single-icon downloads
         self.master.destroy()
 
     def action_about(self):
@@ -815,7 +1407,7 @@ class IdDatabaseEditor(ttk.Frame):
             self.ent_titleid.focus_set()
             return
         tid_n = norm_hex(tid, width=8, lower=True)
-        if len(tid_n) != 8 or not is_hex(tid_n):
+        if not _HEX8(tid_n):
             messagebox.showerror("Invalid TitleID", "TitleID must be 8 hex characters.")
             return
         if tid_n in self.model.titles:
@@ -823,6 +1415,7 @@ class IdDatabaseEditor(ttk.Frame):
             return
         self.model.titles[tid_n] = TitleRecord(title_id=tid_n, title_name=self.var_titlename.get().strip())
         self.model.mark_dirty()
+        self._invalidate_title_index()
         self.populate_titles(select_title_id=tid_n)
         self._update_title()
 
@@ -833,7 +1426,7 @@ class IdDatabaseEditor(ttk.Frame):
 
         new_tid_raw = self.var_titleid.get().strip()
         new_tid = norm_hex(new_tid_raw, width=8, lower=True)
-        if len(new_tid) != 8 or not is_hex(new_tid):
+        if not _HEX8(new_tid):
             messagebox.showerror("Invalid TitleID", "TitleID must be 8 hex characters.")
             return
 
@@ -856,18 +1449,33 @@ class IdDatabaseEditor(ttk.Frame):
             if cache_dir:
                 oldp = icon_cache_path(cache_dir, old_tid)
                 newp = icon_cache_path(cache_dir, new_tid)
+                # link-then-unlink instead of exists+exists+rename: no stat
+                # calls, and unlike os.rename it never clobbers an icon the
+                # destination id already has
                 try:
-                    if os.path.exists(oldp) and not os.path.exists(newp):
-                        os.rename(oldp, newp)
-                except Exception:
+                    os.makedirs(os.path.dirname(newp), exist_ok=True)
+                    os.link(oldp, newp)
+                except FileNotFoundError:
+                    pass  # no cached icon under the old id
+                except FileExistsError:
+                    pass  # destination already has its own icon; keep it
+                except OSError:
                     pass
+                else:
+                    try:
+                        os.unlink(oldp)
+                    except OSError:
+                        pass
 
-            # mem cache rename
+            # mem cache rename; touch recency since the title was just edited
             if old_tid in self._icon_mem and new_tid not in self._icon_mem:
                 self._icon_mem[new_tid] = self._icon_mem.pop(old_tid)
+                self._icon_mem.move_to_end(new_tid)
 
         tr.title_name = new_name
+        tr.mark_mutated()
         self.model.mark_dirty()
+        self._invalidate_title_index()
         self.populate_titles(select_title_id=tr.title_id)
         self.populate_buckets()
         self._update_title()
@@ -882,21 +1490,28 @@ class IdDatabaseEditor(ttk.Frame):
         if not tr:
             return
         base = tr.title_id
-        used = set(tr.content_ids)
-        cand = None
-        for i in range(0, 0x100000000):
-            cid = f"{base}{i:08x}"
-            if cid not in used:
-                cand = cid
-                break
-        if not cand:
+        # smallest free numeric suffix, computed from the existing ids
+        # instead of probing candidate strings one by one
+        used_suffixes = set()
+        for cid in tr.content_ids:
+            if len(cid) == 16 and cid.startswith(base):
+                try:
+                    used_suffixes.add(int(cid[8:], 16))
+                except ValueError:
+                    pass
+        i = 0
+        while i in used_suffixes:
+            i += 1
+        if i > 0xFFFFFFFF:
             messagebox.showerror("Add DLC", "Could not find a free ContentID.")
             return
-        tr.content_ids.append(cand)
-        tr.content_ids = sorted(set(tr.content_ids))
+        cand = f"{base}{i:08x}"
+        bisect.insort(tr.content_ids, cand)  # list stays sorted-unique
+        tr.mark_mutated()
         self.model.mark_dirty()
         self.populate_dlc()
-        idx = tr.content_ids.index(cand)
+        idx = bisect.bisect_left(tr.content_ids, cand)
+        self.lst_dlc.ensure_rendered(idx)
         self.lst_dlc.selection_clear(0, "end")
         self.lst_dlc.selection_set(idx)
         self.lst_dlc.see(idx)
@@ -908,9 +1523,11 @@ class IdDatabaseEditor(ttk.Frame):
         if not tr:
             return
         tr.title_updates.append("0000000000000000")
+        tr.mark_mutated()
         self.model.mark_dirty()
         self.populate_tu()
         idx = len(tr.title_updates) - 1
+        self.lst_tu.ensure_rendered(idx)
         self.lst_tu.selection_clear(0, "end")
         self.lst_tu.selection_set(idx)
         self.lst_tu.see(idx)
@@ -921,12 +1538,19 @@ class IdDatabaseEditor(ttk.Frame):
         tr = self.current_title()
         if not tr:
             return
-        sha = "0" * 40
+        # same idea as Add DLC: pick the smallest free numeric placeholder
+        used = set()
+        for k in tr.tu_known:
+            try:
+                used.add(int(k, 16))
+            except ValueError:
+                pass
         n = 0
-        while sha in tr.tu_known and n < 9999:
+        while n in used:
             n += 1
-            sha = (f"{n:040x}")[-40:]
+        sha = f"{n:040x}"[-40:]
         tr.tu_known[sha] = ""
+        tr.mark_mutated()
         self.model.mark_dirty()
         self.populate_known()
         self.select_known_sha1(sha)
@@ -945,6 +1569,7 @@ class IdDatabaseEditor(ttk.Frame):
                 return
             tr.content_ids.pop(idxs[0])
             tr.archived.pop(cid, None)
+            tr.mark_mutated()
             self.model.mark_dirty()
             self.populate_dlc()
         elif bucket == "TU":
@@ -955,6 +1580,7 @@ class IdDatabaseEditor(ttk.Frame):
             if not messagebox.askyesno("Remove TU", f"Remove Title Update ID:\n{tuid}?"):
                 return
             tr.title_updates.pop(idxs[0])
+            tr.mark_mutated()
             self.model.mark_dirty()
             self.populate_tu()
         elif bucket == "KNOWN":
@@ -965,6 +1591,7 @@ class IdDatabaseEditor(ttk.Frame):
             if not messagebox.askyesno("Remove Known", f"Remove Known mapping for SHA1:\n{sha}?"):
                 return
             tr.tu_known.pop(sha, None)
+            tr.mark_mutated()
             self.model.mark_dirty()
             self.populate_known()
 
@@ -991,7 +1618,7 @@ class IdDatabaseEditor(ttk.Frame):
             raw_id = self.var_detail_id.get().strip()
             if tab == "DLC":
                 new_id = norm_hex(raw_id, width=16, lower=True)
-                if len(new_id) != 16 or not is_hex(new_id):
+                if not _HEX16(new_id):
                     messagebox.showerror("Invalid ContentID", "ContentID must be 16 hex characters.")
                     return
                 if not new_id.startswith(tr.title_id):
@@ -1006,30 +1633,47 @@ class IdDatabaseEditor(ttk.Frame):
                     return
                 old_id = tr.content_ids[idxs[0]]
 
-                tr.content_ids[idxs[0]] = new_id
-                tr.content_ids = sorted(set(tr.content_ids))
+                if new_id != old_id:
+                    tr.content_ids.pop(idxs[0])
+                    pos = bisect.bisect_left(tr.content_ids, new_id)
+                    if pos == len(tr.content_ids) or tr.content_ids[pos] != new_id:
+                        tr.content_ids.insert(pos, new_id)
 
                 archived = bool(self.var_detail_archived.get())
                 name = self.var_detail_name.get().strip()
 
-                if old_id != new_id:
-                    if old_id in tr.archived and new_id not in tr.archived:
-                        tr.archived[new_id] = tr.archived.pop(old_id)
-                    else:
-                        tr.archived.pop(old_id, None)
-
+                # one pop + at most one insert: carry the old entry's label
+                # through a rename instead of writing tr.archived twice
+                old_val = tr.archived.pop(old_id, None) if old_id != new_id else None
                 if archived:
-                    tr.archived[new_id] = name or tr.archived.get(new_id, "") or ""
+                    cur = tr.archived[new_id] if new_id in tr.archived else old_val
+                    tr.archived[new_id] = name or cur or ""
                 else:
                     tr.archived.pop(new_id, None)
 
+                tr.mark_mutated()
                 self.model.mark_dirty()
-                self.populate_dlc(select_id=new_id)
+
+                # surgical row update — rewriting the whole Listbox per
+                # edit is O(N) widget work for a one-row change
+                row = idxs[0]
+                new_row = bisect.bisect_left(tr.content_ids, new_id)
+                self.lst_dlc.delete(row)
+                if self.lst_dlc.size() != len(tr.content_ids):
+                    # moved (or unchanged id): insert at its sorted spot
+                    self.lst_dlc.insert(new_row, self._dlc_label(tr, new_id))
+                else:
+                    # collapsed into an existing row; refresh its label
+                    self.lst_dlc.delete(new_row)
+                    self.lst_dlc.insert(new_row, self._dlc_label(tr, new_id))
+                self.lst_dlc.selection_clear(0, "end")
+                self.lst_dlc.selection_set(new_row)
+                self.lst_dlc.see(new_row)
                 self._update_title()
 
             else:  # TU
                 new_id = norm_hex(raw_id, width=16, lower=True)
-                if len(new_id) != 16 or not is_hex(new_id):
+                if not _HEX16(new_id):
                     messagebox.showerror("Invalid TU ID", "Title Update ID must be 16 hex characters.")
                     return
                 idxs = self.lst_tu.curselection()
@@ -1044,8 +1688,19 @@ class IdDatabaseEditor(ttk.Frame):
                         cleaned.append(x)
                 tr.title_updates = cleaned
 
+                tr.mark_mutated()
                 self.model.mark_dirty()
-                self.populate_tu(select_id=new_id)
+                if len(cleaned) == self.lst_tu.size():
+                    # in-place rename: touch just the one row
+                    row = tr.title_updates.index(new_id)
+                    self.lst_tu.delete(row)
+                    self.lst_tu.insert(row, new_id)
+                    self.lst_tu.selection_clear(0, "end")
+                    self.lst_tu.selection_set(row)
+                    self.lst_tu.see(row)
+                else:
+                    # dedupe dropped a row; rebuild
+                    self.populate_tu(select_id=new_id)
                 self._update_title()
 
             return
@@ -1053,7 +1708,7 @@ class IdDatabaseEditor(ttk.Frame):
         if tab == "KNOWN":
             sha_raw = self.var_known_sha1.get().strip()
             sha = norm_hex(sha_raw, width=40, lower=True)
-            if len(sha) != 40 or not is_hex(sha):
+            if not _HEX40(sha):
                 messagebox.showerror("Invalid SHA1", "SHA1 must be 40 hex characters.")
                 return
             val = self.var_known_value.get().strip()
@@ -1067,9 +1722,10 @@ class IdDatabaseEditor(ttk.Frame):
                 if sha in tr.tu_known:
                     messagebox.showerror("SHA1 In Use", "That SHA1 key already exists.")
                     return
-                tr.tu_known[sha] = tr.tu_known.pop(old_sha)
+                tr.tu_known.pop(old_sha, None)
 
             tr.tu_known[sha] = val
+            tr.mark_mutated()
             self.model.mark_dirty()
             self.populate_known(select_sha=sha)
             self._update_title()
@@ -1082,31 +1738,35 @@ class IdDatabaseEditor(ttk.Frame):
     def action_validate(self):
         issues = []
 
-        for tid, tr in self.model.titles.items():
-            if len(tid) != 8 or not is_hex(tid):
+        for tid in sorted(self.model.titles.keys()):
+            tr = self.model.get(tid)  # validation is a full scan; promote
+            name = tr.title_name
+            if not _HEX8(tid):
                 issues.append(f"{tid}: TitleID invalid")
 
-            for cid in tr.content_ids:
-                if len(cid) != 16 or not is_hex(cid):
-                    issues.append(f"{tid} '{tr.title_name}': ContentID invalid: {cid}")
-                if not cid.startswith(tid):
-                    issues.append(f"{tid} '{tr.title_name}': ContentID does not start with TitleID: {cid}")
-
-            for cid in tr.archived.keys():
-                if len(cid) != 16 or not is_hex(cid):
-                    issues.append(f"{tid} '{tr.title_name}': Archived ContentID invalid: {cid}")
-                if cid not in tr.content_ids:
-                    issues.append(f"{tid} '{tr.title_name}': Archived entry not in Content IDs: {cid}")
+            # Batch each check over sets, then format only the offenders.
+            # In particular "archived entry not in Content IDs" becomes one
+            # set difference instead of a list scan per archived entry.
+            cid_set = tr.cid_set()
+            for cid in sorted(c for c in cid_set if not _HEX16(c)):
+                issues.append(f"{tid} '{name}': ContentID invalid: {cid}")
+            for cid in sorted(c for c in cid_set if not c.startswith(tid)):
+                issues.append(f"{tid} '{name}': ContentID does not start with TitleID: {cid}")
+
+            archived_keys = tr.archived.keys()
+            for cid in sorted(c for c in archived_keys if not _HEX16(c)):
+                issues.append(f"{tid} '{name}': Archived ContentID invalid: {cid}")
+            for cid in sorted(archived_keys - cid_set):
+                issues.append(f"{tid} '{name}': Archived entry not in Content IDs: {cid}")
 
             for tu in tr.title_updates:
-                if len(tu) != 16 or not is_hex(tu):
-                    issues.append(f"{tid} '{tr.title_name}': TU invalid: {tu}")
+                if not _HEX16(tu):
+                    issues.append(f"{tid} '{name}': TU invalid: {tu}")
 
-            for sha1, val in tr.tu_known.items():
-                if len(sha1) != 40 or not is_hex(sha1):
-                    issues.append(f"{tid} '{tr.title_name}': Known SHA1 invalid: {sha1}")
-                if val is None:
-                    issues.append(f"{tid} '{tr.title_name}': Known SHA1 has empty value: {sha1}")
+            for sha1 in sorted(s for s in tr.tu_known if not _HEX40(s)):
+                issues.append(f"{tid} '{name}': Known SHA1 invalid: {sha1}")
+            for sha1 in sorted(s for s, v in tr.tu_known.items() if v is None):
+                issues.append(f"{tid} '{name}': Known SHA1 has empty value: {sha1}")
 
         if issues:
             messagebox.showwarning("Validation", "Issues found:\n\n" + "\n".join(issues[:80]) + ("\n… (more)" if len(issues) > 80 else ""))
@@ -1117,11 +1777,7 @@ class IdDatabaseEditor(ttk.Frame):
         path = filedialog.askopenfilename(title="Pick file to hash (SHA1)")
         if not path:
             return
-        try:
-            digest = self.compute_sha1(path)
-            messagebox.showinfo("SHA1", f"SHA1 = {digest}")
-        except Exception as e:
-            messagebox.showerror("SHA1 Error", f"Failed to hash file:\n{e}")
+        self._hash_in_background(path, lambda digest: messagebox.showinfo("SHA1", f"SHA1 = {digest}"))
 
     def action_compute_sha1_to_known(self):
         tab = self._current_tab_name()
@@ -1131,37 +1787,127 @@ class IdDatabaseEditor(ttk.Frame):
         path = filedialog.askopenfilename(title="Pick file to hash (SHA1)")
         if not path:
             return
-        try:
-            digest = self.compute_sha1(path)
+
+        def done(digest: str):
             self.var_known_sha1.set(digest)
             messagebox.showinfo("SHA1", f"SHA1 = {digest}\n\nNow set the Value and click Apply Changes.")
-        except Exception as e:
-            messagebox.showerror("SHA1 Error", f"Failed to hash file:\n{e}")
+
+        self._hash_in_background(path, done)
+
+    def _hash_in_background(self, path: str, on_done):
+        """
+        Hash in a worker thread so a multi-GB title update doesn't freeze
+        the Tk mainloop; the result is marshalled back via master.after.
+        """
+        def worker():
+            try:
+                digest = self.compute_sha1(path)
+            except Exception as e:
+                self.master.after(0, lambda e=e: messagebox.showerror("SHA1 Error", f"Failed to hash file:\n{e}"))
+                return
+            self.master.after(0, lambda: on_done(digest))
+
+        threading.Thread(target=worker, daemon=True).start()
 
     @staticmethod
     def compute_sha1(path: str) -> str:
-        h = hashlib.sha1()
         with open(path, "rb") as f:
-            for chunk in iter(lambda: f.read(1024 * 1024), b""):
-                h.update(chunk)
-        return h.hexdigest()
+            if hasattr(hashlib, "file_digest"):  # 3.11+: zero-copy fast path
+                return hashlib.file_digest(f, "sha1").hexdigest()
+            # pre-3.11: hash the whole mapping in one update so OpenSSL
+            # runs it under a single GIL release with no read() copies
+            try:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    return hashlib.sha1(memoryview(mm)).hexdigest()
+            except (ValueError, OSError):
+                pass  # empty file or unmappable fs; fall through
+            f.seek(0)
+            h = hashlib.sha1()
+            buf = bytearray(1024 * 1024)
+            mv = memoryview(buf)
+            while True:
+                n = f.readinto(buf)
+                if not n:
+                    break
+                h.update(mv[:n])
+            return h.hexdigest()
 
     # ---------------------------
     # Populate / Selection
     # ---------------------------
 
+    # how many title rows get pushed into the Listbox at a time; the rest
+    # render lazily as the user scrolls toward the bottom
+    TITLE_RENDER_CHUNK = 500
+
+    # quiet period after the last search keystroke before refiltering
+    SEARCH_DEBOUNCE_MS = 120
+
+    def _schedule_search(self):
+        """Coalesce a burst of search keystrokes into one repopulate."""
+        # normalize here, once per edit, so the hot paths never touch Tcl
+        self._search_q_lower = (self.search_var.get() or "").lower().strip()
+        if self._search_after_id is not None:
+            self.master.after_cancel(self._search_after_id)
+        self._search_after_id = self.master.after(self.SEARCH_DEBOUNCE_MS, self.populate_titles)
+
+    def _invalidate_title_index(self):
+        self._all_titles = None
+        self._search_cache = ("", [])
+
+    def _title_index(self) -> List[Tuple[str, str, str]]:
+        """
+        Sorted (tid, display, lowercased display) for all titles, built
+        once per DB change; the lowered copy keeps search matching from
+        re-lowercasing every row on every filter pass.
+        """
+        if self._all_titles is None:
+            index: List[Tuple[str, str, str]] = []
+            for tid in sorted(self.model.titles.keys()):
+                name = self.model.title_name_of(tid)
+                disp = f"{name} ({tid})" if name else tid
+                index.append((tid, disp, disp.lower()))
+            self._all_titles = index
+        return self._all_titles
+
+    def _render_more_titles(self, upto: Optional[int] = None):
+        """Append filtered rows to the Listbox, up to `upto` (or one chunk)."""
+        vis = self._visible_titles
+        if upto is None:
+            upto = self._rendered_count + self.TITLE_RENDER_CHUNK
+        upto = min(upto, len(vis))
+        if upto > self._rendered_count:
+            # one Python->Tcl roundtrip for the whole batch, not one per row
+            self.titles_list.insert("end", *(t[1] for t in vis[self._rendered_count:upto]))
+            self._rendered_count = upto
+
+    def _on_titles_scroll(self, first: str, last: str):
+        # render the next chunk as the visible window nears the bottom
+        if float(last) > 0.9 and self._rendered_count < len(self._visible_titles):
+            self._render_more_titles()
+
     def populate_titles(self, select_first: bool = False, select_title_id: Optional[str] = None):
+        # direct callers (open/new/apply) may land while a debounce timer is
+        # pending; cancel it or it fires again 120 ms after this repopulate
+        if self._search_after_id is not None:
+            self.master.after_cancel(self._search_after_id)
+            self._search_after_id = None
         self.titles_list.delete(0, "end")
 
-        q = (self.search_var.get() or "").lower().strip()
+        q = self._search_q_lower
 
-        visible: List[Tuple[str, str]] = []
-        for tid in sorted(self.model.titles.keys()):
-            tr = self.model.titles[tid]
-            disp = f"{tr.title_name} ({tid})" if tr.title_name else tid
-            if not q or q in disp.lower() or q in tid.lower():
-                visible.append((tid, disp))
-                self.titles_list.insert("end", disp)
+        if q:
+            prev_q, prev_vis = self._search_cache
+            # typing forward: the new result is a subset of the old one
+            base = prev_vis if (prev_q and q.startswith(prev_q)) else self._title_index()
+            visible = [t for t in base if q in t[2] or q in t[0]]
+        else:
+            visible = list(self._title_index())
+        self._search_cache = (q, visible)
+
+        self._visible_titles = visible
+        self._rendered_count = 0
+        self._render_more_titles()
 
         if not visible:
             self._selected_title_id = None
@@ -1172,15 +1918,17 @@ class IdDatabaseEditor(ttk.Frame):
             return
 
         if select_title_id:
-            idx = next((i for i, (tid, _) in enumerate(visible) if tid == select_title_id), 0)
+            idx = next((i for i, t in enumerate(visible) if t[0] == select_title_id), 0)
         elif self._selected_title_id:
-            idx = next((i for i, (tid, _) in enumerate(visible) if tid == self._selected_title_id), 0)
+            idx = next((i for i, t in enumerate(visible) if t[0] == self._selected_title_id), 0)
         else:
             idx = 0
 
         if select_first:
             idx = 0
 
+        if idx >= self._rendered_count:
+            self._render_more_titles(upto=idx + 1)
         self.titles_list.selection_set(idx)
         self.titles_list.see(idx)
         self.on_title_select()
@@ -1206,62 +1954,82 @@ class IdDatabaseEditor(ttk.Frame):
         self._load_icon_for_title(tr.title_id)
 
     def populate_buckets(self):
-        self.populate_dlc()
-        self.populate_tu()
-        self.populate_known()
+        # defer to idle: a cascade of calls within one event (title select,
+        # repopulate, apply) collapses into a single refresh per bucket
+        self._mark_ui_dirty("DLC", "TU", "KNOWN")
+
+    def _mark_ui_dirty(self, *tabs: str) -> None:
+        if not self._ui_dirty:
+            self.master.after_idle(self._flush_ui)
+        self._ui_dirty.update(tabs)
+
+    def _flush_ui(self) -> None:
+        dirty, self._ui_dirty = self._ui_dirty, set()
+        if "DLC" in dirty:
+            self.populate_dlc()
+        if "TU" in dirty:
+            self.populate_tu()
+        if "KNOWN" in dirty:
+            self.populate_known()
+
+    @staticmethod
+    def _dlc_label(tr: TitleRecord, cid: str) -> str:
+        name = tr.archived.get(cid, "")
+        prefix = "✓ " if cid in tr.archived else ""
+        label = f"{prefix}{cid}"
+        if name:
+            label += f" — {name}"
+        return label
 
     def populate_dlc(self, select_id: Optional[str] = None):
-        self.lst_dlc.delete(0, "end")
         tr = self.current_title()
         if not tr:
+            self.lst_dlc.set_items([])
             return
 
-        for cid in tr.content_ids:
-            name = tr.archived.get(cid, "")
-            prefix = "✓ " if cid in tr.archived else ""
-            label = f"{prefix}{cid}"
-            if name:
-                label += f" — {name}"
-            self.lst_dlc.insert("end", label)
+        self.lst_dlc.set_items([self._dlc_label(tr, cid) for cid in tr.content_ids])
 
         if tr.content_ids:
-            if select_id and select_id in tr.content_ids:
-                idx = tr.content_ids.index(select_id)
+            if select_id and select_id in tr.cid_set():
+                idx = bisect.bisect_left(tr.content_ids, select_id)
             else:
                 idx = 0
+            self.lst_dlc.ensure_rendered(idx)
             self.lst_dlc.selection_clear(0, "end")
             self.lst_dlc.selection_set(idx)
 
     def populate_tu(self, select_id: Optional[str] = None):
-        self.lst_tu.delete(0, "end")
         tr = self.current_title()
         if not tr:
+            self.lst_tu.set_items([])
             return
-        for tuid in tr.title_updates:
-            self.lst_tu.insert("end", tuid)
+        self.lst_tu.set_items(list(tr.title_updates))
         if tr.title_updates:
             idx = tr.title_updates.index(select_id) if (select_id and select_id in tr.title_updates) else 0
+            self.lst_tu.ensure_rendered(idx)
             self.lst_tu.selection_clear(0, "end")
             self.lst_tu.selection_set(idx)
 
     def _known_visible_list(self, tr: TitleRecord) -> List[Tuple[str, str]]:
-        items = [(sha, tr.tu_known.get(sha, "")) for sha in tr.tu_known.keys()]
-        return sorted(items, key=lambda x: ((x[1] or "").lower(), x[0]))
+        if tr._known_sorted is None:
+            tr._known_sorted = sorted(
+                tr.tu_known.items(), key=lambda x: ((x[1] or "").lower(), x[0])
+            )
+        return tr._known_sorted
 
     def populate_known(self, select_sha: Optional[str] = None):
-        self.lst_known.delete(0, "end")
         tr = self.current_title()
         if not tr:
+            self.lst_known.set_items([])
             return
         vis = self._known_visible_list(tr)
-        for sha, val in vis:
-            label = f"{sha} — {val}" if val else sha
-            self.lst_known.insert("end", label)
+        self.lst_known.set_items([f"{sha} — {val}" if val else sha for sha, val in vis])
         if vis:
             if select_sha:
                 idx = next((i for i, (sha, _) in enumerate(vis) if sha == select_sha), 0)
             else:
                 idx = 0
+            self.lst_known.ensure_rendered(idx)
             self.lst_known.selection_clear(0, "end")
             self.lst_known.selection_set(idx)
 
@@ -1273,6 +2041,7 @@ class IdDatabaseEditor(ttk.Frame):
         idx = next((i for i, (s, _) in enumerate(vis) if s == sha), None)
         if idx is None:
             return
+        self.lst_known.ensure_rendered(idx)
         self.lst_known.selection_clear(0, "end")
         self.lst_known.selection_set(idx)
         self.lst_known.see(idx)
@@ -1357,18 +2126,14 @@ class IdDatabaseEditor(ttk.Frame):
         if not idxs:
             return None
 
-        q = (self.search_var.get() or "").lower().strip()
-        visible: List[str] = []
-        for tid in sorted(self.model.titles.keys()):
-            tr = self.model.titles[tid]
-            disp = f"{tr.title_name} ({tid})" if tr.title_name else tid
-            if not q or q in disp.lower() or q in tid.lower():
-                visible.append(tid)
-
+        # _visible_titles mirrors the Listbox rows one-to-one — populate_titles
+        # is the only writer of either — so mapping a row index back to its
+        # TitleID is a plain lookup, no refiltering
+        rows = self._visible_titles
         i = idxs[0]
-        if i < 0 or i >= len(visible):
+        if i < 0 or i >= len(rows):
             return None
-        return self.model.titles.get(visible[i])
+        return self.model.get(rows[i][0])
 
     def clear_title_fields(self):
         self.var_titleid.set("")
@@ -1402,7 +2167,9 @@ def main():
             # set icon cache dir near the json by default
             app.icon_cache_dir = default_icon_cache_dir(default)
             ensure_dir(app.icon_cache_dir)
+            migrate_flat_icon_cache(app.icon_cache_dir)
 
+            app._invalidate_title_index()
             app.populate_titles(select_first=True)
             app._update_title()
         except Exception as e: